@@ -17,12 +17,11 @@ import redis  # version: 4.0+
 from threading import Lock
 
 from config.security import SecurityConfig
-from api.auth.utils import AuthUtils, extract_token, is_token_blacklisted
+from api.auth.utils import AuthUtils, blacklist_token, extract_token, is_token_blacklisted
 from core.cache import RedisClient
 
 # Token-related constants
 TOKEN_TYPE: Final[str] = 'access'
-TOKEN_BLACKLIST_PREFIX: Final[str] = 'blacklist:'
 TOKEN_CACHE_PREFIX: Final[str] = 'token_cache:'
 
 class JWTHandler:
@@ -173,12 +172,7 @@ class JWTHandler:
             ttl = int((exp_time - datetime.utcnow()).total_seconds())
 
             # Add to blacklist with TTL
-            blacklist_key = f"{TOKEN_BLACKLIST_PREFIX}{clean_token}"
-            success = bool(self._redis_client.setex(
-                blacklist_key,
-                ttl,
-                "1"
-            ))
+            success = blacklist_token(clean_token, ttl)
 
             # Clear validation cache
             with self._cache_lock:
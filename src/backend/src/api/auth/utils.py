@@ -10,6 +10,7 @@ Version: 1.0
 
 import jwt  # version: 2.0+
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Optional, Any
 import redis  # version: 4.0+
 
@@ -135,12 +136,7 @@ class AuthUtils:
             )
             
             # Add to blacklist with TTL
-            blacklist_key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
-            return bool(self._redis_client.setex(
-                blacklist_key,
-                ttl,
-                "1"
-            ))
+            return blacklist_token(token, ttl)
             
         except Exception as e:
             raise AuthError(
@@ -207,6 +203,38 @@ def extract_token(auth_header: Optional[str]) -> str:
         
     return token
 
+@lru_cache(maxsize=1)
+def _get_blacklist_client() -> redis.Redis:
+    """Returns the Redis client for the token blacklist store, created once and shared."""
+    return redis.Redis(
+        host=SecurityConfig.REDIS_HOST,
+        port=SecurityConfig.REDIS_PORT,
+        decode_responses=True
+    )
+
+def _blacklist_add(token: str, ttl: int) -> bool:
+    """Stores a token in the Redis blacklist for ``ttl`` seconds."""
+    blacklist_key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
+    return bool(_get_blacklist_client().setex(blacklist_key, ttl, "1"))
+
+def _blacklist_has(token: str) -> bool:
+    """Checks the Redis blacklist for a token."""
+    blacklist_key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
+    return bool(_get_blacklist_client().exists(blacklist_key))
+
+def blacklist_token(token: str, ttl: int) -> bool:
+    """
+    Adds a token to the Redis-backed blacklist.
+
+    Args:
+        token (str): The token to blacklist
+        ttl (int): Seconds until the blacklist entry expires
+
+    Returns:
+        bool: True if blacklisting successful
+    """
+    return _blacklist_add(token, ttl)
+
 def is_token_blacklisted(token: str) -> bool:
     """
     Checks if a token is in the Redis-backed blacklist.
@@ -218,13 +246,7 @@ def is_token_blacklisted(token: str) -> bool:
         bool: True if token is blacklisted, False otherwise
     """
     try:
-        redis_client = redis.Redis(
-            host=SecurityConfig.REDIS_HOST,
-            port=SecurityConfig.REDIS_PORT,
-            decode_responses=True
-        )
-        blacklist_key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
-        return bool(redis_client.exists(blacklist_key))
+        return _blacklist_has(token)
     except redis.ConnectionError:
         # If Redis is unavailable, assume token is not blacklisted
         # This prevents system lockout but should trigger monitoring alert
@@ -233,6 +255,7 @@ def is_token_blacklisted(token: str) -> bool:
 __all__ = [
     'verify_token',
     'extract_token',
+    'blacklist_token',
     'is_token_blacklisted',
     'AuthUtils',
     'AuthError'
@@ -122,8 +122,7 @@ async def create_item():
     """
     try:
         # Validate request data
-        data = request.get_json()
-        item_data = ItemCreate(**data)
+        item_data = ItemCreate.fast_parse_json(request.get_data(cache=False))
         
         # Initialize service
         item_service = ItemService()
@@ -116,7 +116,7 @@ async def create_project():
         logger.debug(f"Creating project for user {g.user_id}")
         
         # Validate request data
-        project_data = ProjectCreate(**request.get_json())
+        project_data = ProjectCreate.fast_parse_json(request.get_data(cache=False))
         
         # Create project
         project_service = ProjectService()
@@ -183,7 +183,7 @@ async def update_project(project_id: int):
         logger.debug(f"Updating project {project_id} for user {g.user_id}")
         
         # Validate request data
-        project_data = ProjectCreate(**request.get_json())
+        project_data = ProjectCreate.fast_parse_json(request.get_data(cache=False))
         
         # Update project
         project_service = ProjectService()
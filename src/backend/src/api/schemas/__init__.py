@@ -40,7 +40,8 @@ from .items import (  # v1.0.0
     ItemBase,
     ItemCreate,
     ItemUpdate,
-    ItemInDB
+    ItemInDB,
+    ItemList
 )
 
 # Export all schemas for API usage
@@ -66,5 +67,6 @@ __all__ = [
     'ItemBase',
     'ItemCreate',
     'ItemUpdate',
-    'ItemInDB'
+    'ItemInDB',
+    'ItemList'
 ]
\ No newline at end of file
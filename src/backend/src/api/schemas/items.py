@@ -6,9 +6,10 @@ Version: 1.0.0
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, validator, constr, conint  # pydantic v1.9+
 
+from .compiled import CompiledSchemaMixin, get_compiled_validator
 from ...utils.validators import (
     validate_content_length,
     validate_order_index,
@@ -16,7 +17,7 @@ from ...utils.validators import (
     MAX_ITEMS_PER_SPECIFICATION,
 )
 
-class ItemBase(BaseModel):
+class ItemBase(CompiledSchemaMixin, BaseModel):
     """
     Base Pydantic model for item validation with enhanced security measures.
     Implements strict content and ordering validation with security patterns.
@@ -130,6 +131,9 @@ class ItemCreate(ItemBase):
             }
         }
 
+# Compile the request body validator once at import
+get_compiled_validator(ItemCreate)
+
 class ItemUpdate(BaseModel):
     """
     Schema for updating existing items with optional fields and validation.
@@ -230,4 +234,32 @@ class ItemResponse(ItemBase):
                 "order_index": 0,
                 "created_at": "2024-01-20T12:00:00Z"
             }
-        }
\ No newline at end of file
+        }
+
+class ItemList(BaseModel):
+    """
+    Schema for validating a batch of items in a single pass.
+    Enforces the per-specification item limit with one length check before
+    any item is validated.
+    """
+    __root__: List[ItemBase]
+
+    @validator('__root__', pre=True)
+    def validate_items_limit(cls, items: List) -> List:
+        """
+        Rejects batches exceeding the maximum items per specification.
+
+        Args:
+            items: Raw list of item payloads
+
+        Returns:
+            List: Unmodified item payloads for per-item validation
+
+        Raises:
+            ValueError: If the batch exceeds the items limit
+        """
+        if isinstance(items, list) and len(items) > MAX_ITEMS_PER_SPECIFICATION:
+            raise ValueError(
+                f"Maximum number of items ({MAX_ITEMS_PER_SPECIFICATION}) reached for specification"
+            )
+        return items
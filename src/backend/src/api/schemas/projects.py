@@ -10,11 +10,12 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, validator, constr
 
+from .compiled import CompiledSchemaMixin, get_compiled_validator
 from ...utils.validators import validate_content_length
 from ...db.models.projects import Project
 from ...utils.constants import DATABASE_CONSTANTS
 
-class ProjectBase(BaseModel):
+class ProjectBase(CompiledSchemaMixin, BaseModel):
     """
     Base Pydantic model for project data validation with enhanced error handling
     and strict type checking.
@@ -23,6 +24,7 @@ class ProjectBase(BaseModel):
     title: constr(
         min_length=1,
         max_length=DATABASE_CONSTANTS['MAX_TITLE_LENGTH'],
+        regex=r'^[^<>&;]*$',
         strip_whitespace=True
     )
 
@@ -77,6 +79,9 @@ class ProjectCreate(ProjectBase):
     """
     pass
 
+# Compile the request body validator once at import
+get_compiled_validator(ProjectCreate)
+
 
 class ProjectResponse(ProjectBase):
     """
@@ -10,28 +10,71 @@ Version: 1.0
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 import re
 
+import emval  # version: 0.1.3
 from pydantic import BaseModel, Field, EmailStr, validator
+from pydantic.validators import str_validator
 
 # Import User model for ORM integration
 from db.models.users import User
 
 # Constants for validation
 GOOGLE_ID_PATTERN = r'^[0-9]{21}$'  # Google ID format validation
+GOOGLE_ID_REGEX = re.compile(GOOGLE_ID_PATTERN)
+MALICIOUS_EMAIL_CHARS_REGEX = re.compile(r'[<>{}*$]')
 MAX_EMAIL_LENGTH = 255
+# Special-use TLDs rejected by python-email-validator but accepted by emval
+SPECIAL_USE_EMAIL_TLDS = frozenset({'arpa', 'invalid', 'local', 'localhost', 'onion', 'test'})
 MIN_GOOGLE_ID_LENGTH = 21
 MAX_GOOGLE_ID_LENGTH = 21
 
+class FastEmailStr(EmailStr):
+    """
+    EmailStr variant validated by the Rust-backed emval validator instead of
+    python-email-validator. Keeps EmailStr's schema and constraint handling.
+    """
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[..., Any]]:
+        yield str_validator
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        """
+        Validates and normalizes an email address.
+
+        Args:
+            value (str): Email address to validate
+
+        Returns:
+            str: Normalized email address
+
+        Raises:
+            ValueError: If the address is not a valid email
+        """
+        try:
+            normalized = emval.validate_email(value, deliverable_address=False).normalized
+        except (SyntaxError, ValueError) as exc:
+            raise ValueError("value is not a valid email address") from exc
+
+        # emval allows dotless and special-use domains; keep EmailStr's stricter rules
+        domain = normalized.rpartition('@')[2]
+        if '.' not in domain or domain.rsplit('.', 1)[-1] in SPECIAL_USE_EMAIL_TLDS:
+            raise ValueError("value is not a valid email address")
+
+        return normalized
+
 class UserBase(BaseModel):
     """
     Base Pydantic model for user data validation with enhanced security measures.
     
     Attributes:
-        email (EmailStr): Validated user email address
+        email (FastEmailStr): Validated user email address
     """
-    email: EmailStr = Field(
+    email: FastEmailStr = Field(
         ...,  # Required field
         max_length=MAX_EMAIL_LENGTH,
         description="User's email address"
@@ -58,7 +101,7 @@ class UserBase(BaseModel):
             raise ValueError(f"Email length cannot exceed {MAX_EMAIL_LENGTH} characters")
         
         # Check for common malicious patterns
-        if re.search(r'[<>{}*$]', value):
+        if MALICIOUS_EMAIL_CHARS_REGEX.search(value):
             raise ValueError("Email contains invalid characters")
             
         return value.lower()  # Normalize email to lowercase
@@ -69,7 +112,7 @@ class UserCreate(UserBase):
     
     Attributes:
         google_id (str): Validated Google account identifier
-        email (EmailStr): Inherited from UserBase
+        email (FastEmailStr): Inherited from UserBase
     """
     google_id: str = Field(
         ...,  # Required field
@@ -96,7 +139,7 @@ class UserCreate(UserBase):
         if not value:
             raise ValueError("Google ID cannot be empty")
         
-        if not re.match(GOOGLE_ID_PATTERN, value):
+        if not GOOGLE_ID_REGEX.match(value):
             raise ValueError("Invalid Google ID format")
             
         return value
@@ -116,7 +159,7 @@ class UserResponse(BaseModel):
     
     Attributes:
         google_id (str): Google account identifier
-        email (EmailStr): User's email address
+        email (FastEmailStr): User's email address
         created_at (datetime): Account creation timestamp
         last_login (datetime): Last login timestamp
     """
@@ -124,7 +167,7 @@ class UserResponse(BaseModel):
         ...,
         description="Google account identifier"
     )
-    email: EmailStr = Field(
+    email: FastEmailStr = Field(
         ...,
         description="User's email address"
     )
@@ -12,6 +12,7 @@ Version: 1.0
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional, Any, Final
 from config.settings import get_config
 from utils.constants import CACHE_CONSTANTS
@@ -49,11 +50,14 @@ CACHE_TTL: Final[Dict[str, int]] = {
     'user_data': CACHE_CONSTANTS['USER_CACHE_TTL']            # 900s (15 min)
 }
 
+@lru_cache(maxsize=1024)
 def get_cache_key_pattern(resource_type: str, resource_id: Optional[str] = None, 
                          version: Optional[str] = None) -> str:
     """
     Generate a cache key pattern for different resource types with optional versioning.
 
+    The result depends only on the arguments, so patterns are memoized.
+
     Args:
         resource_type (str): Type of resource (project_list, specifications, items, user_data)
         resource_id (Optional[str]): Specific resource identifier
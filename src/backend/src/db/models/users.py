@@ -24,6 +24,7 @@ from db.session import Base
 
 # Email validation regex pattern
 EMAIL_REGEX: str = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+EMAIL_PATTERN: re.Pattern = re.compile(EMAIL_REGEX)
 
 class User(Base):
     """
@@ -116,7 +117,7 @@ class User(Base):
         """
         if not email:
             return False
-        return bool(re.match(EMAIL_REGEX, email))
+        return bool(EMAIL_PATTERN.match(email))
 
     def update_last_login(self) -> None:
         """
@@ -6,6 +6,7 @@ for specifications within projects.
 Version: 1.0.0
 """
 
+import json
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
@@ -49,7 +50,7 @@ class SpecificationRepository(BaseRepository[Specification]):
         project_id: int,
         owner_id: str,
         use_cache: bool = True
-    ) -> List[Specification]:
+    ) -> List[Any]:
         """
         Retrieve all specifications for a project with caching and ownership validation.
 
@@ -59,7 +60,7 @@ class SpecificationRepository(BaseRepository[Specification]):
             use_cache: Whether to use cache (default: True)
 
         Returns:
-            List[Specification]: Ordered list of specifications
+            List[Any]: Ordered specifications; specification dictionaries on a cache hit
 
         Raises:
             ValueError: If project_id is invalid
@@ -70,7 +71,7 @@ class SpecificationRepository(BaseRepository[Specification]):
             if use_cache:
                 cache_key = f"{self._cache_prefix}:project:{project_id}"
                 cached_data = self._get_from_cache(cache_key)
-                if cached_data:
+                if cached_data is not None:
                     self._logger.debug(f"Cache hit for project specifications: {project_id}")
                     return cached_data
 
@@ -354,7 +355,7 @@ class SpecificationRepository(BaseRepository[Specification]):
                 }
             )
 
-    def _get_from_cache(self, cache_key: str) -> Optional[List[Specification]]:
+    def _get_from_cache(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
         """
         Retrieve specifications from cache with error handling.
 
@@ -362,11 +363,12 @@ class SpecificationRepository(BaseRepository[Specification]):
             cache_key: Cache key to retrieve
 
         Returns:
-            Optional[List[Specification]]: Cached specifications or None
+            Optional[List[Dict[str, Any]]]: Decoded cached specifications or None
         """
         try:
-            return self._cache_client.get(cache_key)
-        except RedisError as e:
+            cached = self._cache_client.get(cache_key)
+            return json.loads(cached) if cached is not None else None
+        except (RedisError, ValueError) as e:
             self._logger.warning(
                 "Cache retrieval failed",
                 extra={
@@ -391,10 +393,21 @@ class SpecificationRepository(BaseRepository[Specification]):
             ttl: Time-to-live in seconds
         """
         try:
+            # Redis stores bytes, so cache specifications as JSON dictionaries
+            payload = json.dumps([
+                {
+                    'spec_id': spec.spec_id,
+                    'project_id': spec.project_id,
+                    'content': spec.content,
+                    'order_index': spec.order_index,
+                    'created_at': spec.created_at.isoformat() if spec.created_at else None
+                }
+                for spec in data
+            ])
             self._cache_client.setex(
                 cache_key,
                 ttl,
-                data
+                payload
             )
         except RedisError as e:
             self._logger.warning(
@@ -13,6 +13,7 @@ Version: 1.0
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from datetime import datetime
 from prometheus_client import Counter, Histogram
@@ -37,11 +38,24 @@ class AuthenticationService:
     JWT tokens, rate limiting, and monitoring.
     """
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_google_client(cls) -> GoogleAuthClient:
+        """Return the Google OAuth client shared by all service instances."""
+        return GoogleAuthClient()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_jwt_handler(cls) -> JWTHandler:
+        """Return the JWT handler shared by all service instances."""
+        return JWTHandler()
+
     def __init__(self) -> None:
         """Initialize authentication service with required dependencies and metrics."""
-        # Initialize dependencies
-        self._google_client = GoogleAuthClient()
-        self._jwt_handler = JWTHandler()
+        # Bind shared stateless dependencies; instance attributes remain overridable
+        self._google_client = self._get_google_client()
+        self._jwt_handler = self._get_jwt_handler()
+        # Repository owns a database session, so it must stay per instance
         self._user_repository = UserRepository()
 
         # Initialize metrics collectors
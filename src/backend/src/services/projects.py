@@ -26,6 +26,25 @@ from ..utils.constants import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _to_response(project) -> ProjectResponse:
+    """
+    Build a ProjectResponse from a trusted repository row without re-running
+    field validators. Untrusted request bodies still go through ProjectCreate.
+
+    Args:
+        project: Project ORM instance returned by the repository
+
+    Returns:
+        ProjectResponse: Response schema instance
+    """
+    return ProjectResponse.construct(
+        project_id=project.project_id,
+        title=project.title,
+        owner_id=project.owner_id,
+        created_at=project.created_at,
+        updated_at=project.updated_at
+    )
+
 class ProjectService:
     """
     Thread-safe service class implementing project management business logic with
@@ -69,7 +88,7 @@ class ProjectService:
             projects = self._repository.get_by_owner(owner_id)
             
             # Convert to response schema and cache
-            project_responses = [ProjectResponse.from_orm(project) for project in projects]
+            project_responses = [_to_response(project) for project in projects]
             project_data = [response.dict() for response in project_responses]
             
             # Cache the results
@@ -117,7 +136,7 @@ class ProjectService:
             # Invalidate user's project cache
             invalidate_project_cache(str(project.project_id))
 
-            response = ProjectResponse.from_orm(project)
+            response = _to_response(project)
             logger.info(f"Successfully created project {project.project_id} for user {owner_id}")
             return response
 
@@ -170,7 +189,7 @@ class ProjectService:
             # Invalidate caches
             invalidate_project_cache(str(project_id))
 
-            response = ProjectResponse.from_orm(updated_project)
+            response = _to_response(updated_project)
             logger.info(f"Successfully updated project {project_id}")
             return response
 
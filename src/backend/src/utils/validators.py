@@ -9,6 +9,7 @@ Version: 1.0.0
 """
 
 import re
+from functools import lru_cache
 from typing import Union, Optional
 from datetime import datetime
 
@@ -19,11 +20,14 @@ EMAIL_REGEX = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 MAX_ITEMS_PER_SPECIFICATION = 10
 MAX_CONTENT_LENGTH = 1000
 MIN_CONTENT_LENGTH = 1
+MAX_ORDER_INDEX = 1000000
 
 # Compile regex patterns for performance
 EMAIL_PATTERN = re.compile(EMAIL_REGEX)
 GOOGLE_ID_PATTERN = re.compile(r'^[0-9]{21}$')  # Google ID format validation
 DANGEROUS_CHARS_PATTERN = re.compile(r'[<>&;]')  # Basic XSS prevention
+DANGEROUS_CHARS_TABLE = dict.fromkeys(map(ord, '<>&;'))  # str.translate deletion table
+EMAIL_REJECT_CHARS_PATTERN = re.compile(r'[<>&;\s\x00-\x1f]')  # Linear-time email prefilter
 
 def validate_email(email: Optional[str]) -> bool:
     """
@@ -41,28 +45,31 @@ def validate_email(email: Optional[str]) -> bool:
         >>> validate_email("invalid.email@")
         False
     """
-    try:
-        if not email:
-            return False
-            
-        email = str(email).strip()
+    # Non-strings are rejected before the cache, which needs hashable keys
+    if not email or not isinstance(email, str):
+        return False
         
-        # Basic length validation
-        if len(email) < 5 or len(email) > 255:
-            return False
-            
-        # Check against RFC 5322 pattern
-        if not EMAIL_PATTERN.match(email):
-            return False
-            
-        # Check for dangerous characters
-        if DANGEROUS_CHARS_PATTERN.search(email):
-            return False
-            
-        return True
+    email = email.strip()
+    
+    # Basic length validation, also bounding the size of cached keys
+    if len(email) < 5 or len(email) > 255:
+        return False
         
-    except Exception:
+    return _match_email(email)
+
+@lru_cache(maxsize=8192)
+def _match_email(email: str) -> bool:
+    """
+    Runs the structural and pattern checks for a stripped, length-checked email.
+    Results are memoized since the same address is validated by several layers.
+    """
+    # Structural prefilter: reject malformed and dangerous input in a single
+    # linear scan before running the full pattern
+    if email.count('@') != 1 or EMAIL_REJECT_CHARS_PATTERN.search(email):
         return False
+        
+    # Check against RFC 5322 pattern
+    return EMAIL_PATTERN.match(email) is not None
 
 def validate_content_length(content: Optional[str]) -> bool:
     """
@@ -91,8 +98,9 @@ def validate_content_length(content: Optional[str]) -> bool:
         if content_length < MIN_CONTENT_LENGTH or content_length > MAX_CONTENT_LENGTH:
             return False
             
-        # Security validation
-        if DANGEROUS_CHARS_PATTERN.search(content):
+        # Security validation: translate deletes dangerous characters in one
+        # C-level pass, so any length change means one was present
+        if len(content.translate(DANGEROUS_CHARS_TABLE)) != content_length:
             return False
             
         return True
@@ -116,26 +124,25 @@ def validate_order_index(order_index: Optional[Union[int, str]]) -> bool:
         >>> validate_order_index(-1)
         False
     """
-    try:
-        if order_index is None:
-            return False
-            
-        # Convert to int if string
-        if isinstance(order_index, str):
-            order_index = int(order_index)
-            
-        # Type validation
-        if not isinstance(order_index, int):
-            return False
-            
-        # Range validation
-        if order_index < 0 or order_index > 1000000:
+    # bool is an int subclass but never a valid index
+    if isinstance(order_index, bool):
+        return False
+        
+    if isinstance(order_index, int):
+        return 0 <= order_index <= MAX_ORDER_INDEX
+        
+    # Character-class check instead of int() coercion, so invalid strings
+    # never raise; an optional sign is allowed, making '-0' valid
+    if isinstance(order_index, str):
+        text = order_index.strip()
+        sign = text[:1] if text[:1] in ('+', '-') else ''
+        digits = text[len(sign):]
+        if not (digits.isascii() and digits.isdecimal()):
             return False
-            
-        return True
+        value = int(digits)
+        return (value == 0 or sign != '-') and value <= MAX_ORDER_INDEX
         
-    except (ValueError, TypeError):
-        return False
+    return False
 
 def validate_items_count(current_count: Optional[Union[int, str]]) -> bool:
     """
@@ -190,25 +197,11 @@ def validate_google_id(google_id: Optional[str]) -> bool:
         >>> validate_google_id("invalid_id")
         False
     """
-    try:
-        if not google_id:
-            return False
-            
-        google_id = str(google_id).strip()
-        
-        # Length validation
-        if len(google_id) != 21:
-            return False
-            
-        # Format validation
-        if not GOOGLE_ID_PATTERN.match(google_id):
-            return False
-            
-        # Security validation
-        if DANGEROUS_CHARS_PATTERN.search(google_id):
-            return False
-            
-        return True
+    if not google_id or not isinstance(google_id, str):
+        return False
         
-    except Exception:
-        return False
\ No newline at end of file
+    google_id = google_id.strip()
+    
+    # Length and format validation; isascii() rejects non-ASCII decimal digits
+    # that isdecimal() alone accepts, and an all-digit ID has no dangerous chars
+    return len(google_id) == 21 and google_id.isascii() and google_id.isdecimal()
\ No newline at end of file
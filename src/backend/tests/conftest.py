@@ -12,14 +12,16 @@ Version: 1.0
 """
 
 import pytest
-from typing import Generator, Dict, Any
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import QueuePool
+from typing import Generator, Dict, Any, Callable, List, Optional, Tuple
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from db.session import Base, get_db
 from db.models.users import User
-from api.auth.jwt import create_access_token
+from api.auth.jwt import JWTHandler, create_access_token
 from config.settings import TestingConfig
 from utils.constants import DATABASE_CONSTANTS
 
@@ -27,51 +29,191 @@ from utils.constants import DATABASE_CONSTANTS
 TEST_USER_GOOGLE_ID: str = 'test_google_id_123'
 TEST_USER_EMAIL: str = 'test@example.com'
 
-@pytest.fixture
-def get_test_db() -> Generator[Session, None, None]:
+# SQLite connection settings for the in-memory test database
+SQLITE_TEST_PRAGMAS: Tuple[str, ...] = (
+    'PRAGMA synchronous=OFF',
+    'PRAGMA journal_mode=MEMORY',
+    'PRAGMA temp_store=MEMORY',
+)
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """
+    Skips benchmark-marked tests unless the run was started with ``--benchmark-only``.
+
+    Args:
+        config (pytest.Config): pytest configuration object
+        items (List[pytest.Item]): Collected test items
+    """
+    if config.getoption("--benchmark-only", default=False):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="benchmark tests run only with --benchmark-only")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+@pytest.fixture(scope="session")
+def jwt_handler() -> JWTHandler:
+    """
+    Provides a JWT handler shared across the test session.
+
+    Returns:
+        JWTHandler: Configured JWT handler instance
     """
-    Creates and manages a high-performance test database session with proper connection pooling
-    and transaction isolation.
+    return JWTHandler()
+
+@pytest.fixture(scope="session")
+def mock_factory() -> Callable[[Optional[type]], MagicMock]:
+    """
+    Provides a session-wide factory for dependency mocks restricted to a class spec.
 
     Returns:
-        Generator[Session]: SQLAlchemy session configured for high-performance testing
+        Callable: Factory building a fresh ``MagicMock(spec=spec)`` per call
     """
-    # Create test database engine with optimized pooling
+    def factory(spec: Optional[type] = None) -> MagicMock:
+        return MagicMock(spec=spec)
+    return factory
+
+@pytest.fixture(scope="session")
+def precomputed_token(jwt_handler: JWTHandler) -> str:
+    """
+    Generates a signed access token once per session for tests where signing is not under test.
+
+    Args:
+        jwt_handler (JWTHandler): Session-scoped JWT handler
+
+    Returns:
+        str: Signed JWT access token
+    """
+    return jwt_handler.generate_token({'sub': 'test_user', 'email': TEST_USER_EMAIL})
+
+@pytest.fixture(autouse=True)
+def _inmem_blacklist(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Replaces the Redis token blacklist store with an in-process set for each test.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture
+    """
+    store = set()
+    monkeypatch.setattr('api.auth.utils._blacklist_add', lambda token, ttl: store.add(token) or True)
+    monkeypatch.setattr('api.auth.utils._blacklist_has', store.__contains__)
+
+@pytest.fixture(scope="session")
+def test_engine() -> Generator[Engine, None, None]:
+    """
+    Creates the test database engine and schema once per test session.
+
+    Returns:
+        Generator[Engine]: SQLAlchemy engine bound to the test database
+    """
+    database_url = make_url(TestingConfig.SQLALCHEMY_DATABASE_URI)
+    is_sqlite = database_url.get_backend_name() == 'sqlite'
+
+    # Create test database engine sharing a single connection across the session
     engine = create_engine(
-        TestingConfig.SQLALCHEMY_DATABASE_URI,
-        poolclass=QueuePool,
-        pool_size=5,
-        max_overflow=20,
-        pool_timeout=30,
-        pool_pre_ping=True,
+        database_url,
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False} if is_sqlite else {},
         echo=False
     )
 
+    if is_sqlite:
+        @event.listens_for(engine, 'connect')
+        def _configure_connection(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            # Enforce foreign keys so row cleanup and cascades respect table ordering
+            cursor.execute('PRAGMA foreign_keys=ON')
+            # Durability is irrelevant for a throwaway database; skip fsync and disk journals
+            for pragma in SQLITE_TEST_PRAGMAS:
+                cursor.execute(pragma)
+            cursor.close()
+            # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest correctly
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, 'begin')
+        def _begin_transaction(conn):
+            conn.exec_driver_sql('BEGIN')
+
     # Create all tables in test database
     Base.metadata.create_all(bind=engine)
 
-    # Create session factory with performance settings
-    TestingSessionLocal = sessionmaker(
-        bind=engine,
-        autocommit=False,
-        autoflush=True,  # Enable autoflush for immediate constraint checking
-        expire_on_commit=False  # Prevent detached instance errors
-    )
-
-    # Create and yield test session
-    session = TestingSessionLocal()
     try:
-        yield session
+        yield engine
     finally:
-        # Rollback any pending transactions
-        session.rollback()
-        # Close session
-        session.close()
         # Drop all tables for cleanup
         Base.metadata.drop_all(bind=engine)
         # Dispose engine connections
         engine.dispose()
 
+@pytest.fixture(scope="module")
+def db_connection(test_engine: Engine) -> Generator[Connection, None, None]:
+    """
+    Opens a module-wide connection wrapped in an outer transaction that is never committed.
+
+    Args:
+        test_engine (Engine): Session-scoped test database engine
+
+    Returns:
+        Generator[Connection]: Connection with an active outer transaction
+    """
+    connection = test_engine.connect()
+    outer = connection.begin()
+    try:
+        yield connection
+    finally:
+        outer.rollback()
+        connection.close()
+
+@pytest.fixture
+def db_session(db_connection: Connection) -> Generator[Session, None, None]:
+    """
+    Provides a session isolated in a SAVEPOINT that is rolled back after each test.
+
+    Commits and rollbacks issued by the test only end an inner SAVEPOINT, which is
+    restarted automatically, so nothing escapes the per-test savepoint.
+
+    Args:
+        db_connection (Connection): Module-scoped connection
+
+    Returns:
+        Generator[Session]: Session bound to the module connection
+    """
+    test_savepoint = db_connection.begin_nested()
+    session = Session(bind=db_connection, expire_on_commit=False)
+    nested = db_connection.begin_nested()
+
+    @event.listens_for(session, 'after_transaction_end')
+    def _restart_savepoint(sess, transaction):
+        nonlocal nested
+        if not nested.is_active:
+            nested = db_connection.begin_nested()
+
+    try:
+        yield session
+    finally:
+        # Stop restarting savepoints before closing, so only the test savepoint is rolled back
+        event.remove(session, 'after_transaction_end', _restart_savepoint)
+        session.close()
+        test_savepoint.rollback()
+
+@pytest.fixture
+def get_test_db(db_session: Session) -> Session:
+    """
+    Provides the per-test database session to fixtures that persist shared test data.
+
+    Bound to ``db_session`` so rows created here are visible to the test and rolled
+    back with its savepoint instead of opening a second transaction on the shared
+    connection.
+
+    Args:
+        db_session (Session): Savepoint-isolated test session
+
+    Returns:
+        Session: SQLAlchemy session for the current test
+    """
+    return db_session
+
 @pytest.fixture
 def test_user(get_test_db: Session) -> User:
     """
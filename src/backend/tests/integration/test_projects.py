@@ -205,6 +205,37 @@ def test_delete_project(db_session: Any, test_client: Any, auth_headers: Dict[st
     ).first()
     assert deleted_project is None
 
+@pytest.mark.integration
+@pytest.mark.parametrize("body", [
+    b'{"title": ',  # Malformed JSON
+    b'[]',  # Array body
+    b'"Test Project"',  # String body
+])
+def test_create_project_invalid_body(
+    db_session: Any,
+    test_client: Any,
+    auth_headers: Dict[str, str],
+    body: bytes
+) -> None:
+    """
+    Test that malformed and non-object request bodies are rejected as bad requests.
+
+    Args:
+        db_session: SQLAlchemy database session fixture
+        test_client: Flask test client fixture
+        auth_headers: Authenticated request headers fixture
+        body: Raw request body
+    """
+    response = test_client.post(
+        PROJECTS_URL,
+        data=body,
+        content_type='application/json',
+        headers=auth_headers
+    )
+
+    assert response.status_code == HTTP_STATUS_CODES['BAD_REQUEST']
+    assert db_session.query(Project).count() == 0
+
 @pytest.mark.integration
 def test_unauthorized_access(db_session: Any, test_client: Any) -> None:
     """
@@ -14,9 +14,10 @@ Version: 1.0
 import pytest
 import json
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Sequence
 from datetime import datetime
 
+from db.models.items import Item
 from utils.constants import (
     DATABASE_CONSTANTS,
     HTTP_STATUS_CODES,
@@ -28,26 +29,34 @@ from utils.constants import (
 BASE_URL = '/api/v1/specifications'
 TEST_PROJECT_ID = 1
 RESPONSE_TIME_THRESHOLD = 500  # milliseconds
+INVALID_AUTH_HEADERS = {'Authorization': 'Bearer invalid_token'}
+
+# Test payloads, built once at import
+_SPEC_PAYLOADS = tuple(
+    {'content': f'Test Specification {i}', 'project_id': TEST_PROJECT_ID, 'order_index': i}
+    for i in range(3)
+)
+_ITEMS = tuple({'content': f'Test Item {i}', 'order_index': i} for i in range(3))
+
+def _seed_items(db_session, spec_id: int, items: Sequence[Dict[str, Any]]) -> None:
+    """
+    Insert specification items directly in a single bulk statement and commit.
+
+    Args:
+        db_session: Database session fixture
+        spec_id: ID of the parent specification
+        items: Item payloads containing content and order_index
+    """
+    db_session.bulk_insert_mappings(
+        Item,
+        [{'spec_id': spec_id, **item} for item in items]
+    )
+    db_session.commit()
 
 @pytest.mark.integration
 class TestSpecificationsAPI:
     """Integration test suite for specifications API endpoints."""
 
-    def __init__(self):
-        """Initialize test class with test data."""
-        self.test_data: Dict[str, Any] = {
-            'specification': {
-                'content': 'Test Specification',
-                'project_id': TEST_PROJECT_ID,
-                'order_index': 1
-            },
-            'items': [
-                {'content': f'Test Item {i}', 'order_index': i}
-                for i in range(3)
-            ]
-        }
-        self.start_time: float = 0.0
-
     def setup_method(self, method):
         """
         Setup method for each test with database preparation and performance monitoring.
@@ -56,7 +65,7 @@ class TestSpecificationsAPI:
             method: Test method being executed
         """
         # Record start time for performance measurement
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
 
         # Clear any existing test data
         self.teardown_method(method)
@@ -69,8 +78,8 @@ class TestSpecificationsAPI:
             method: Test method being executed
         """
         # Log performance metrics
-        execution_time = (time.time() - self.start_time) * 1000
-        print(f"\nTest {method.__name__} execution time: {execution_time:.2f}ms")
+        execution_time = (time.perf_counter_ns() - self.start_time) // 1_000_000
+        print(f"\nTest {method.__name__} execution time: {execution_time}ms")
 
     @pytest.mark.integration
     def test_get_project_specifications_authenticated(
@@ -88,19 +97,14 @@ class TestSpecificationsAPI:
             db_session: Database session fixture
         """
         # Record start time for performance measurement
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # Create test specifications
-        for i in range(3):
-            spec_data = {
-                'content': f'Test Specification {i}',
-                'project_id': TEST_PROJECT_ID,
-                'order_index': i
-            }
+        for payload in _SPEC_PAYLOADS:
             response = test_client.post(
                 BASE_URL,
                 headers=auth_headers,
-                json=spec_data
+                json=payload
             )
             assert response.status_code == HTTP_STATUS_CODES['CREATED']
 
@@ -130,7 +134,7 @@ class TestSpecificationsAPI:
         assert data['data']['metadata']['page'] == 1
 
         # Validate performance
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - start_time) // 1_000_000
         assert execution_time < RESPONSE_TIME_THRESHOLD
 
     @pytest.mark.integration
@@ -148,7 +152,7 @@ class TestSpecificationsAPI:
         # Test with invalid token
         response = test_client.get(
             f"{BASE_URL}/project/{TEST_PROJECT_ID}",
-            headers={'Authorization': 'Bearer invalid_token'}
+            headers=INVALID_AUTH_HEADERS
         )
         assert response.status_code == HTTP_STATUS_CODES['UNAUTHORIZED']
 
@@ -173,13 +177,13 @@ class TestSpecificationsAPI:
             auth_headers: Authentication headers fixture
             db_session: Database session fixture
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # Create specification
         response = test_client.post(
             BASE_URL,
             headers=auth_headers,
-            json=self.test_data['specification']
+            json=_SPEC_PAYLOADS[0]
         )
 
         # Validate response
@@ -189,13 +193,13 @@ class TestSpecificationsAPI:
         # Validate created specification
         assert 'data' in data
         spec = data['data']
-        assert spec['content'] == self.test_data['specification']['content']
+        assert spec['content'] == _SPEC_PAYLOADS[0]['content']
         assert spec['project_id'] == TEST_PROJECT_ID
-        assert spec['order_index'] == 1
+        assert spec['order_index'] == _SPEC_PAYLOADS[0]['order_index']
         assert 'created_at' in spec
 
         # Validate performance
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - start_time) // 1_000_000
         assert execution_time < RESPONSE_TIME_THRESHOLD
 
         # Test validation errors
@@ -226,19 +230,15 @@ class TestSpecificationsAPI:
             auth_headers: Authentication headers fixture
             db_session: Database session fixture
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # Create test specifications
         spec_ids = []
-        for i in range(3):
+        for payload in _SPEC_PAYLOADS:
             response = test_client.post(
                 BASE_URL,
                 headers=auth_headers,
-                json={
-                    'content': f'Test Specification {i}',
-                    'project_id': TEST_PROJECT_ID,
-                    'order_index': i
-                }
+                json=payload
             )
             data = json.loads(response.data)
             spec_ids.append(data['data']['id'])
@@ -273,9 +273,46 @@ class TestSpecificationsAPI:
         assert specs[2]['id'] == spec_ids[0]
 
         # Validate performance
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - start_time) // 1_000_000
         assert execution_time < RESPONSE_TIME_THRESHOLD
 
+    @pytest.mark.integration
+    def test_create_specification_item(
+        self,
+        test_client,
+        auth_headers,
+        db_session
+    ):
+        """
+        Test item creation through the specification items endpoint.
+
+        Args:
+            test_client: Flask test client fixture
+            auth_headers: Authentication headers fixture
+            db_session: Database session fixture
+        """
+        # Create parent specification
+        response = test_client.post(
+            BASE_URL,
+            headers=auth_headers,
+            json=_SPEC_PAYLOADS[0]
+        )
+        spec_id = json.loads(response.data)['data']['id']
+
+        # Create item
+        item = _ITEMS[0]
+        response = test_client.post(
+            f"{BASE_URL}/{spec_id}/items",
+            headers=auth_headers,
+            json=item
+        )
+        assert response.status_code == HTTP_STATUS_CODES['CREATED']
+
+        # Validate created item
+        data = json.loads(response.data)
+        assert data['data']['content'] == item['content']
+        assert data['data']['order_index'] == item['order_index']
+
     @pytest.mark.integration
     def test_delete_specification(
         self,
@@ -291,24 +328,18 @@ class TestSpecificationsAPI:
             auth_headers: Authentication headers fixture
             db_session: Database session fixture
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # Create test specification
         response = test_client.post(
             BASE_URL,
             headers=auth_headers,
-            json=self.test_data['specification']
+            json=_SPEC_PAYLOADS[0]
         )
         spec_id = json.loads(response.data)['data']['id']
 
         # Add items to specification
-        for item in self.test_data['items']:
-            response = test_client.post(
-                f"{BASE_URL}/{spec_id}/items",
-                headers=auth_headers,
-                json=item
-            )
-            assert response.status_code == HTTP_STATUS_CODES['CREATED']
+        _seed_items(db_session, spec_id, _ITEMS)
 
         # Delete specification
         response = test_client.delete(
@@ -332,12 +363,12 @@ class TestSpecificationsAPI:
         assert response.status_code == HTTP_STATUS_CODES['NOT_FOUND']
 
         # Validate performance
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - start_time) // 1_000_000
         assert execution_time < RESPONSE_TIME_THRESHOLD
 
         # Test unauthorized deletion
         response = test_client.delete(
             f"{BASE_URL}/{spec_id}",
-            headers={'Authorization': 'Bearer invalid_token'}
+            headers=INVALID_AUTH_HEADERS
         )
         assert response.status_code == HTTP_STATUS_CODES['UNAUTHORIZED']
\ No newline at end of file
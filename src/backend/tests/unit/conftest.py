@@ -0,0 +1,48 @@
+"""
+Unit test configuration for the Specification Management API.
+
+This module configures the collection order for unit tests with:
+- Optimized test collection and execution
+
+Markers, test discovery and duration reporting are configured in pyproject.toml.
+
+Version: 1.0
+"""
+
+import pytest
+from pathlib import Path
+from typing import List
+from pytest import Config, Item
+
+# Unit tests are identified by their location under this directory
+UNIT_TEST_DIR: Path = Path(__file__).parent
+
+def pytest_collection_modifyitems(config: Config, items: List[Item]) -> None:
+    """
+    Modifies test collection for optimized execution order.
+
+    Args:
+        config: pytest configuration object
+        items: List of collected test items
+
+    Modifications include:
+    - Adding unit test markers
+    - Optimizing execution order (independent, then db, then auth tests)
+
+    Database and authentication tests are identified by explicit
+    ``@pytest.mark.db`` / ``@pytest.mark.auth`` markers at the test definition.
+    Items outside this directory keep their collection order.
+    """
+    unit = pytest.mark.unit
+    unit_items = set()
+
+    # Tag every unit item in a single pass
+    for item in items:
+        if UNIT_TEST_DIR in Path(str(item.fspath)).parents:
+            item.add_marker(unit)
+            unit_items.add(item.nodeid)
+
+    # Configure test execution order; the sort is stable, so ties keep collection order
+    items.sort(key=lambda i: (
+        ("db" in i.keywords) + ("auth" in i.keywords) if i.nodeid in unit_items else 0
+    ))
@@ -13,6 +13,8 @@ Version: 1.0
 
 import pytest
 import jwt
+import requests
+import responses  # version: 0.17+
 from unittest import mock
 from datetime import datetime, timedelta
 from freezegun import freeze_time  # version: 1.0+
@@ -23,7 +25,26 @@ from api.auth.google import GoogleAuthClient, AuthenticationError, ProfileError
 from api.auth.decorators import require_auth
 from api.auth.utils import extract_token, is_token_blacklisted
 from config.security import SecurityConfig
-from utils.constants import AUTH_CONSTANTS, ERROR_MESSAGES, HTTP_STATUS_CODES
+from utils.constants import (
+    AUTH_CONSTANTS,
+    ERROR_MESSAGES,
+    HTTP_STATUS_CODES,
+    RATE_LIMIT_CONSTANTS
+)
+
+GOOGLE_USERINFO_URL = 'https://www.googleapis.com/oauth2/v3/userinfo'
+MOCK_USER_PROFILE = {
+    'sub': 'test_google_id',
+    'email': 'test@example.com',
+    'email_verified': True,
+    'name': 'Test User',
+    'picture': 'https://example.com/photo.jpg'
+}
+
+@pytest.fixture(scope="session")
+def rate_limit_token(jwt_handler: JWTHandler) -> str:
+    """Signed token for the rate-limit subject, generated once per session."""
+    return jwt_handler.generate_token({'sub': 'rate_limit_test'})
 
 def pytest_configure():
     """Configure test environment and dependencies."""
@@ -118,10 +139,9 @@ class TestJWTHandler:
         with pytest.raises(jwt.InvalidTokenError):
             self._jwt_handler.validate_token(invalid_token)
 
-    def test_revoke_token(self):
+    def test_revoke_token(self, precomputed_token):
         """Test JWT token revocation and blacklist management."""
-        # Generate token to revoke
-        token = self._jwt_handler.generate_token(self._test_payload)
+        token = precomputed_token
 
         # Verify token is valid initially
         assert self._jwt_handler.validate_token(token)
@@ -142,16 +162,22 @@ class TestJWTHandler:
 class TestGoogleAuth:
     """Test cases for Google OAuth authentication functionality."""
 
+    @pytest.fixture
+    def google_http(self):
+        """Stub registry for Google API HTTP calls, fresh for each test so replaced responses never leak."""
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as registry:
+            registry.add(
+                responses.GET,
+                GOOGLE_USERINFO_URL,
+                json=MOCK_USER_PROFILE,
+                status=HTTP_STATUS_CODES['OK']
+            )
+            yield registry
+
     def setup_method(self):
         """Set up test environment for Google auth tests."""
         self._google_client = GoogleAuthClient()
-        self._mock_user_profile = {
-            'sub': 'test_google_id',
-            'email': 'test@example.com',
-            'email_verified': True,
-            'name': 'Test User',
-            'picture': 'https://example.com/photo.jpg'
-        }
+        self._mock_user_profile = MOCK_USER_PROFILE
 
     @mock.patch('google.oauth2.id_token.verify_oauth2_token')
     def test_verify_oauth_token(self, mock_verify):
@@ -186,15 +212,8 @@ class TestGoogleAuth:
             self._google_client.verify_oauth_token(token)
         assert ERROR_MESSAGES['AUTH_LOCKOUT'] in str(exc_info.value)
 
-    @mock.patch('requests.Session.get')
-    def test_get_user_profile(self, mock_get):
+    def test_get_user_profile(self, google_http):
         """Test user profile retrieval from Google API."""
-        # Configure mock response
-        mock_response = mock.Mock()
-        mock_response.status_code = HTTP_STATUS_CODES['OK']
-        mock_response.json.return_value = self._mock_user_profile
-        mock_get.return_value = mock_response
-
         # Test successful profile retrieval
         profile = self._google_client.get_user_profile("test_access_token")
         assert profile['google_id'] == self._mock_user_profile['sub']
@@ -202,14 +221,22 @@ class TestGoogleAuth:
         assert profile['email_verified'] == self._mock_user_profile['email_verified']
 
         # Test API error
-        mock_response.status_code = HTTP_STATUS_CODES['BAD_REQUEST']
-        mock_response.text = "API Error"
+        google_http.replace(
+            responses.GET,
+            GOOGLE_USERINFO_URL,
+            body="API Error",
+            status=HTTP_STATUS_CODES['BAD_REQUEST']
+        )
         with pytest.raises(ProfileError) as exc_info:
             self._google_client.get_user_profile("invalid_token")
         assert "Failed to retrieve profile" in str(exc_info.value)
 
         # Test network error
-        mock_get.side_effect = Exception("Network error")
+        google_http.replace(
+            responses.GET,
+            GOOGLE_USERINFO_URL,
+            body=requests.exceptions.ConnectionError("Network error")
+        )
         with pytest.raises(ProfileError) as exc_info:
             self._google_client.get_user_profile("test_token")
         assert "Failed to retrieve user profile" in str(exc_info.value)
@@ -229,44 +256,33 @@ class TestAuthDecorators:
         def protected_route():
             return jsonify({'message': 'success'})
 
-    def test_require_auth(self):
+    @pytest.mark.auth
+    def test_require_auth(self, precomputed_token, rate_limit_token):
         """Test authentication decorator functionality."""
+        invalid_headers = {'Authorization': 'Bearer invalid.token.here'}
+
         # Test without token
         response = self.client.get('/protected')
         assert response.status_code == HTTP_STATUS_CODES['UNAUTHORIZED']
 
         # Test with invalid token
-        response = self.client.get(
-            '/protected',
-            headers={'Authorization': 'Bearer invalid.token.here'}
-        )
+        response = self.client.get('/protected', headers=invalid_headers)
         assert response.status_code == HTTP_STATUS_CODES['UNAUTHORIZED']
 
         # Test with valid token
-        token = self._jwt_handler.generate_token({
-            'sub': 'test_user',
-            'email': 'test@example.com'
-        })
-        response = self.client.get(
-            '/protected',
-            headers={'Authorization': f'Bearer {token}'}
-        )
+        token = precomputed_token
+        valid_headers = {'Authorization': f'Bearer {token}'}
+        response = self.client.get('/protected', headers=valid_headers)
         assert response.status_code == HTTP_STATUS_CODES['OK']
         assert response.json['message'] == 'success'
 
         # Test with blacklisted token
         self._jwt_handler.revoke_token(token)
-        response = self.client.get(
-            '/protected',
-            headers={'Authorization': f'Bearer {token}'}
-        )
+        response = self.client.get('/protected', headers=valid_headers)
         assert response.status_code == HTTP_STATUS_CODES['UNAUTHORIZED']
 
         # Test rate limiting
-        test_token = self._jwt_handler.generate_token({'sub': 'rate_limit_test'})
+        rate_limit_headers = {'Authorization': f'Bearer {rate_limit_token}'}
         for _ in range(RATE_LIMIT_CONSTANTS['REQUESTS_PER_HOUR'] + 1):
-            response = self.client.get(
-                '/protected',
-                headers={'Authorization': f'Bearer {test_token}'}
-            )
-        assert response.status_code == HTTP_STATUS_CODES['RATE_LIMITED']
\ No newline at end of file
+            response = self.client.get('/protected', headers=rate_limit_headers)
+        assert response.status_code == HTTP_STATUS_CODES['RATE_LIMITED']
@@ -12,24 +12,22 @@ Version: 1.0
 """
 
 import pytest
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import patch, Mock
 import fakeredis
+from freezegun import freeze_time  # version: 1.0+
 import json
-import time
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Generator, Iterable, List
 
 from core.cache import (
     get_redis_client,
     CacheManager
 )
-from config.cache import (
-    CACHE_TTL,
-    get_cache_key_pattern
-)
+from config.cache import CACHE_TTL
 
 # Test constants
 TEST_KEY = "test:key"
 TEST_VALUE = {"data": "test_value"}
+TEST_VALUE_JSON = json.dumps(TEST_VALUE)
 TEST_PATTERN = "test:*"
 MOCK_CONFIG = {
     "host": "localhost",
@@ -37,40 +35,72 @@ MOCK_CONFIG = {
     "db": 0
 }
 
-@pytest.fixture
+# Test data sets with values pre-serialized once at import
+TEST_DATA = {
+    "key1": {"value": "test1"},
+    "key2": {"value": "test2"},
+    "key3": [1, 2, 3]
+}
+TTL_TEST_DATA = {
+    "project:1": {"id": 1, "name": "Test Project"},
+    "spec:1": {"id": 1, "content": "Test Spec"},
+    "items:1": [{"id": 1, "content": "Test Item"}]
+}
+PATTERN_TEST_DATA = {
+    "test:1": "value1",
+    "test:2": "value2",
+    "other:1": "value3",
+    "test:sub:1": "value4"
+}
+ENCODED_TEST_DATA = {k: json.dumps(v).encode() for k, v in TEST_DATA.items()}
+ENCODED_TTL_TEST_DATA = {k: json.dumps(v).encode() for k, v in TTL_TEST_DATA.items()}
+ENCODED_PATTERN_TEST_DATA = {k: json.dumps(v).encode() for k, v in PATTERN_TEST_DATA.items()}
+
 class TestCacheFixture:
-    """Pytest fixture providing isolated Redis test environment."""
-    
+    """Isolated Redis test environment shared by the tests in this module."""
+
+    __test__ = False  # Helper class, not a test case
+
     def __init__(self) -> None:
         """Initialize test fixture with mock Redis configuration."""
         self._redis_mock = fakeredis.FakeStrictRedis()
         self._mock_config = MOCK_CONFIG.copy()
-        self._active_keys = []
-        
-        # Configure connection pool settings
-        self._redis_mock.connection_pool = MagicMock()
-        self._redis_mock.connection_pool.max_connections = 100
-        self._redis_mock.connection_pool.timeout = 20
-    
+        self._active_keys: List[str] = []
+
+    def _track_keys(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a write method so every key it touches is recorded for cleanup."""
+        def wrapper(name: str, *args: Any, **kwargs: Any) -> Any:
+            self._active_keys.append(name)
+            return method(name, *args, **kwargs)
+        return wrapper
+
     def setup(self) -> None:
-        """Set up isolated test environment before each test."""
+        """Set up isolated test environment once for the module."""
         # Reset Redis mock state
         self._redis_mock.flushall()
         self._active_keys.clear()
         
         # Configure mock responses
         self._redis_mock.ping = Mock(return_value=True)
-        self._redis_mock.set = Mock(side_effect=self._redis_mock.set)
-        self._redis_mock.get = Mock(side_effect=self._redis_mock.get)
-        self._redis_mock.delete = Mock(side_effect=self._redis_mock.delete)
-        self._redis_mock.scan = Mock(side_effect=self._redis_mock.scan)
+        self._redis_mock.set = self._track_keys(self._redis_mock.set)
+        self._redis_mock.setex = self._track_keys(self._redis_mock.setex)
         
         # Patch Redis client
         self.redis_patcher = patch('core.cache.Redis', return_value=self._redis_mock)
         self.redis_patcher.start()
-    
+
+    def track_keys(self, keys: Iterable[str]) -> None:
+        """Record keys written outside the tracked methods, e.g. through MSET."""
+        self._active_keys.extend(keys)
+
+    def clear_active_keys(self) -> None:
+        """Delete only the keys written since the last clear."""
+        if self._active_keys:
+            self._redis_mock.delete(*self._active_keys)
+            self._active_keys.clear()
+
     def teardown(self) -> None:
-        """Clean up test environment after each test."""
+        """Clean up test environment after the module."""
         # Stop Redis mock patch
         self.redis_patcher.stop()
         
@@ -81,6 +111,20 @@ class TestCacheFixture:
         # Reset mock configuration
         self._mock_config = MOCK_CONFIG.copy()
 
+@pytest.fixture(scope="module")
+def cache_fixture() -> Generator[TestCacheFixture, None, None]:
+    """Module-scoped Redis test environment with a single fake server and patch."""
+    fixture = TestCacheFixture()
+    fixture.setup()
+    yield fixture
+    fixture.teardown()
+
+@pytest.fixture(autouse=True)
+def _clear_cache_keys(cache_fixture: TestCacheFixture) -> Generator[None, None, None]:
+    """Drop the keys each test wrote instead of flushing the whole keyspace."""
+    yield
+    cache_fixture.clear_active_keys()
+
 @pytest.mark.unit
 @patch('core.cache.redis.Redis')
 def test_get_redis_client(mock_redis: Mock, cache_fixture: TestCacheFixture) -> None:
@@ -112,21 +156,13 @@ def test_cache_operations(cache_fixture: TestCacheFixture) -> None:
     """Test comprehensive cache CRUD operations and error handling."""
     client = get_redis_client()
     
-    # Test setting multiple values
-    test_data = {
-        "key1": {"value": "test1"},
-        "key2": {"value": "test2"},
-        "key3": [1, 2, 3]
-    }
+    # Test setting multiple values in a single MSET
+    assert client.mset(ENCODED_TEST_DATA)
+    cache_fixture.track_keys(TEST_DATA)
     
-    for key, value in test_data.items():
-        assert client.set(key, json.dumps(value))
-    
-    # Test bulk retrieval
-    for key, expected in test_data.items():
-        value = client.get(key)
-        assert value is not None
-        assert json.loads(value) == expected
+    # Test bulk retrieval in a single MGET
+    values = client.mget(list(TEST_DATA.keys()))
+    assert [json.loads(value) for value in values] == list(TEST_DATA.values())
     
     # Test partial update
     updated_value = {"value": "updated"}
@@ -148,29 +184,24 @@ def test_cache_ttl(cache_fixture: TestCacheFixture) -> None:
     client = get_redis_client()
     
     # Set values with different TTLs
-    test_data = {
-        "project:1": {"id": 1, "name": "Test Project"},
-        "spec:1": {"id": 1, "content": "Test Spec"},
-        "items:1": [{"id": 1, "content": "Test Item"}]
-    }
-    
-    for key, value in test_data.items():
+    for key, encoded in ENCODED_TTL_TEST_DATA.items():
         resource_type = key.split(":")[0]
         ttl = CACHE_TTL.get(resource_type + "s", 300)  # Default 5 minutes
-        client.setex(key, ttl, json.dumps(value))
+        client.setex(key, ttl, encoded)
     
     # Verify TTLs are set
-    for key in test_data:
+    for key in TTL_TEST_DATA:
         ttl = client.ttl(key)
         assert ttl > 0
     
-    # Test TTL expiration
-    client.setex("expire:test", 1, json.dumps({"test": "value"}))
-    time.sleep(1.1)  # Wait for expiration
-    assert client.get("expire:test") is None
+    # Test TTL expiration by advancing the clock fakeredis reads instead of sleeping
+    with freeze_time() as frozen_clock:
+        client.setex("expire:test", 1, json.dumps({"test": "value"}))
+        frozen_clock.tick(2)
+        assert client.get("expire:test") is None
     
     # Verify non-expired keys remain
-    for key in test_data:
+    for key in TTL_TEST_DATA:
         assert client.get(key) is not None
 
 @pytest.mark.unit
@@ -179,46 +210,24 @@ def test_cache_pattern_clear(cache_fixture: TestCacheFixture) -> None:
     client = get_redis_client()
     
     # Set up test data with different patterns
-    test_data = {
-        "test:1": "value1",
-        "test:2": "value2",
-        "other:1": "value3",
-        "test:sub:1": "value4"
-    }
-    
-    for key, value in test_data.items():
-        client.set(key, json.dumps(value))
-    
-    # Test exact pattern clearing
-    pattern = get_cache_key_pattern("test")
-    cursor = 0
-    deleted = 0
-    
-    while True:
-        cursor, keys = client.scan(cursor, match=pattern)
-        if keys:
-            deleted += client.delete(*keys)
-        if cursor == 0:
-            break
+    for key, encoded in ENCODED_PATTERN_TEST_DATA.items():
+        client.set(key, encoded)
     
+    # Test nested pattern clearing
+    keys = list(client.scan_iter(match="test:sub:*", count=1000))
+    assert client.unlink(*keys) == 1
+
+    assert client.get("test:sub:1") is None
+    assert client.get("test:1") is not None
+
+    # Test prefix pattern clearing
+    keys = list(client.scan_iter(match=TEST_PATTERN, count=1000))
+    assert client.unlink(*keys) == 2
+
     # Verify pattern-matched keys are cleared
     assert client.get("test:1") is None
     assert client.get("test:2") is None
     assert client.get("other:1") is not None
-    
-    # Test nested pattern clearing
-    pattern = get_cache_key_pattern("test:sub")
-    cursor = 0
-    deleted = 0
-    
-    while True:
-        cursor, keys = client.scan(cursor, match=pattern)
-        if keys:
-            deleted += client.delete(*keys)
-        if cursor == 0:
-            break
-    
-    assert client.get("test:sub:1") is None
 
 @pytest.mark.unit
 def test_cache_manager_context(cache_fixture: TestCacheFixture) -> None:
@@ -229,21 +238,26 @@ def test_cache_manager_context(cache_fixture: TestCacheFixture) -> None:
         assert cache.ping()
         
         # Test cache operations within context
-        cache.set(TEST_KEY, json.dumps(TEST_VALUE))
+        cache.set(TEST_KEY, TEST_VALUE_JSON)
         value = cache.get(TEST_KEY)
         assert json.loads(value) == TEST_VALUE
     
-    # Test error handling within context
-    with pytest.raises(Exception):
-        with CacheManager() as cache:
-            cache.ping = Mock(side_effect=ConnectionError("Connection lost"))
-            cache.ping()
+    # Test connection verification failure on enter
+    broken_client = Mock()
+    broken_client.ping.side_effect = ConnectionError("Connection lost")
+    with patch('core.cache.get_redis_client', return_value=broken_client):
+        with pytest.raises(ConnectionError, match="Connection lost"):
+            with CacheManager():
+                pass
     
     # Test context reentry
+    r1, r2 = Mock(), Mock()
     manager = CacheManager()
-    with manager as cache1:
-        assert cache1 is not None
-    
-    with manager as cache2:
-        assert cache2 is not None
-        assert cache1 is not cache2  # Should be new connection
\ No newline at end of file
+    with patch('core.cache.get_redis_client', side_effect=[r1, r2]):
+        with manager as cache1:
+            assert cache1 is r1
+        
+        with manager as cache2:
+            assert cache2 is r2  # Should be new connection
+    r1.close.assert_called_once()
+    r2.close.assert_called_once()
\ No newline at end of file
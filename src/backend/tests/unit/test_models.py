@@ -7,7 +7,11 @@ Version: 1.0.0
 
 import pytest
 from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Generator
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
 
 from db.models.users import User
 from db.models.projects import Project
@@ -15,6 +19,50 @@ from db.models.specifications import Specification
 from db.models.items import Item
 from utils.constants import DATABASE_CONSTANTS
 
+@pytest.fixture(scope="class")
+def class_session(db_connection: Connection) -> Generator[Session, None, None]:
+    """Session for rows shared by a test class, rolled back when the class finishes."""
+    savepoint = db_connection.begin_nested()
+    session = Session(bind=db_connection, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        session.close()
+        savepoint.rollback()
+
+@pytest.fixture(scope="class")
+def base_user(class_session: Session) -> User:
+    """User created once per test class."""
+    user = User(
+        google_id="123456789012345678901",
+        email="test@example.com"
+    )
+    class_session.add(user)
+    class_session.flush()
+    return user
+
+@pytest.fixture(scope="class")
+def base_project(class_session: Session, base_user: User) -> Project:
+    """Project owned by ``base_user``, created once per test class."""
+    project = Project(
+        title="Test Project",
+        owner_id=base_user.google_id
+    )
+    class_session.add(project)
+    class_session.flush()
+    return project
+
+@pytest.fixture(scope="class")
+def seeded(class_session: Session, base_user: User, base_project: Project) -> SimpleNamespace:
+    """User, project and specification hierarchy created once per test class."""
+    spec = Specification(
+        project_id=base_project.project_id,
+        content="Test Specification"
+    )
+    class_session.add(spec)
+    class_session.flush()
+    return SimpleNamespace(user=base_user, project=base_project, spec=spec)
+
 @pytest.mark.unit
 class TestUserModel:
     """Test suite for User model validation and relationships."""
@@ -33,21 +81,14 @@ class TestUserModel:
         assert isinstance(user.created_at, datetime)
         assert isinstance(user.last_login, datetime)
 
-    def test_user_invalid_email(self, db_session):
-        """Test user creation with invalid email format."""
-        with pytest.raises(ValueError, match="Invalid email format"):
-            User(
-                google_id="123456789012345678901",
-                email="invalid-email"
-            )
-
-    def test_user_invalid_google_id(self, db_session):
-        """Test user creation with invalid Google ID."""
-        with pytest.raises(ValueError, match="google_id cannot be empty"):
-            User(
-                google_id="",
-                email="test@example.com"
-            )
+    @pytest.mark.parametrize("kwargs,msg", [
+        ({"google_id": "", "email": "test@example.com"}, "google_id cannot be empty"),
+        ({"google_id": "123456789012345678901", "email": "invalid-email"}, "Invalid email format"),
+    ])
+    def test_user_validation(self, kwargs, msg):
+        """Test user constructor validation, which raises before any session interaction."""
+        with pytest.raises(ValueError, match=msg):
+            User(**kwargs)
 
     def test_user_email_unique_constraint(self, db_session):
         """Test email uniqueness constraint."""
@@ -56,7 +97,7 @@ class TestUserModel:
             email="test@example.com"
         )
         db_session.add(user1)
-        db_session.commit()
+        db_session.flush()
 
         user2 = User(
             google_id="223456789012345678901",
@@ -64,7 +105,7 @@ class TestUserModel:
         )
         db_session.add(user2)
         with pytest.raises(IntegrityError):
-            db_session.commit()
+            db_session.flush()
         db_session.rollback()
 
     def test_user_project_cascade_delete(self, db_session):
@@ -74,14 +115,13 @@ class TestUserModel:
             email="test@example.com"
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
 
-        project = Project(
+        db_session.add(Project(
             title="Test Project",
             owner_id=user.google_id
-        )
-        db_session.add(project)
-        db_session.commit()
+        ))
+        db_session.flush()
 
         db_session.delete(user)
         db_session.commit()
@@ -95,7 +135,7 @@ class TestUserModel:
             email="test@example.com"
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
 
         original_login = user.last_login
         user.update_last_login()
@@ -107,82 +147,54 @@ class TestUserModel:
 class TestProjectModel:
     """Test suite for Project model validation and relationships."""
 
-    def test_project_creation_valid(self, db_session):
+    def test_project_creation_valid(self, db_session, base_user):
         """Test creation of project with valid data."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        db_session.commit()
-
         project = Project(
             title="Test Project",
-            owner_id=user.google_id
+            owner_id=base_user.google_id
         )
         db_session.add(project)
         db_session.commit()
 
         assert project.title == "Test Project"
-        assert project.owner_id == user.google_id
+        assert project.owner_id == base_user.google_id
         assert isinstance(project.created_at, datetime)
         assert isinstance(project.updated_at, datetime)
 
-    def test_project_title_length_validation(self, db_session):
-        """Test project title length validation."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        with pytest.raises(ValueError, match="Project title cannot exceed"):
-            Project(
-                title="a" * (DATABASE_CONSTANTS['MAX_TITLE_LENGTH'] + 1),
-                owner_id=user.google_id
-            )
+    @pytest.mark.parametrize("title,msg", [
+        ("", "Project title is required"),
+        ("a" * (DATABASE_CONSTANTS['MAX_TITLE_LENGTH'] + 1), "Project title cannot exceed"),
+    ])
+    def test_project_title_validation(self, title, msg):
+        """Test project title validation without a database session."""
+        with pytest.raises(ValueError, match=msg):
+            Project(title=title, owner_id="123456789012345678901")
 
-    def test_project_title_sanitization(self, db_session):
+    def test_project_title_sanitization(self, db_session, base_user):
         """Test project title sanitization."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        db_session.commit()
-
         project = Project(
             title="  Test Project  ",
-            owner_id=user.google_id
+            owner_id=base_user.google_id
         )
         db_session.add(project)
         db_session.commit()
 
         assert project.title == "Test Project"
 
-    def test_project_specification_cascade_delete(self, db_session):
+    def test_project_specification_cascade_delete(self, db_session, base_user):
         """Test cascade deletion of specifications when project is deleted."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        db_session.commit()
-
         project = Project(
             title="Test Project",
-            owner_id=user.google_id
+            owner_id=base_user.google_id
         )
         db_session.add(project)
-        db_session.commit()
+        db_session.flush()
 
-        spec = Specification(
+        db_session.add(Specification(
             project_id=project.project_id,
             content="Test Specification"
-        )
-        db_session.add(spec)
-        db_session.commit()
+        ))
+        db_session.flush()
 
         db_session.delete(project)
         db_session.commit()
@@ -193,22 +205,10 @@ class TestProjectModel:
 class TestSpecificationModel:
     """Test suite for Specification model validation and relationships."""
 
-    def test_specification_creation_valid(self, db_session):
+    def test_specification_creation_valid(self, db_session, base_project):
         """Test creation of specification with valid data."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        project = Project(
-            title="Test Project",
-            owner_id=user.google_id
-        )
-        db_session.add(project)
-        db_session.commit()
-
         spec = Specification(
-            project_id=project.project_id,
+            project_id=base_project.project_id,
             content="Test Specification",
             order_index=0
         )
@@ -219,49 +219,28 @@ class TestSpecificationModel:
         assert spec.order_index == 0
         assert isinstance(spec.created_at, datetime)
 
-    def test_specification_content_validation(self, db_session):
+    def test_specification_content_validation(self, db_session, base_project):
         """Test specification content validation."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        project = Project(
-            title="Test Project",
-            owner_id=user.google_id
-        )
-        db_session.add(project)
-        db_session.commit()
-
         with pytest.raises(ValueError, match="Content must be between"):
             Specification(
-                project_id=project.project_id,
+                project_id=base_project.project_id,
                 content="a" * (DATABASE_CONSTANTS['MAX_CONTENT_LENGTH'] + 1)
             )
 
-    def test_specification_max_limit(self, db_session):
+    def test_specification_max_limit(self, db_session, base_project):
         """Test maximum specifications per project limit."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        project = Project(
-            title="Test Project",
-            owner_id=user.google_id
-        )
-        db_session.add(project)
-        db_session.commit()
+        project = base_project
 
-        # Add maximum allowed specifications
-        for i in range(DATABASE_CONSTANTS['MAX_SPECIFICATIONS_PER_PROJECT']):
-            spec = Specification(
+        # Add maximum allowed specifications in a single bulk insert
+        db_session.bulk_save_objects([
+            Specification(
                 project_id=project.project_id,
                 content=f"Specification {i}",
                 order_index=i
             )
-            db_session.add(spec)
-        db_session.commit()
+            for i in range(DATABASE_CONSTANTS['MAX_SPECIFICATIONS_PER_PROJECT'])
+        ])
+        db_session.flush()
 
         # Try to add one more
         spec = Specification(
@@ -278,24 +257,9 @@ class TestSpecificationModel:
 class TestItemModel:
     """Test suite for Item model validation and relationships."""
 
-    def test_item_creation_valid(self, db_session):
+    def test_item_creation_valid(self, db_session, seeded):
         """Test creation of item with valid data."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        project = Project(
-            title="Test Project",
-            owner_id=user.google_id
-        )
-        db_session.add(project)
-        spec = Specification(
-            project_id=project.project_id,
-            content="Test Specification"
-        )
-        db_session.add(spec)
-        db_session.commit()
+        spec = seeded.spec
 
         item = Item(
             spec_id=spec.spec_id,
@@ -309,34 +273,20 @@ class TestItemModel:
         assert item.order_index == 0
         assert isinstance(item.created_at, datetime)
 
-    def test_item_max_limit(self, db_session):
+    def test_item_max_limit(self, db_session, seeded):
         """Test maximum items per specification limit."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        project = Project(
-            title="Test Project",
-            owner_id=user.google_id
-        )
-        db_session.add(project)
-        spec = Specification(
-            project_id=project.project_id,
-            content="Test Specification"
-        )
-        db_session.add(spec)
-        db_session.commit()
+        spec = seeded.spec
 
-        # Add maximum allowed items
-        for i in range(DATABASE_CONSTANTS['MAX_ITEMS_PER_SPECIFICATION']):
-            item = Item(
+        # Add maximum allowed items in a single bulk insert
+        db_session.bulk_save_objects([
+            Item(
                 spec_id=spec.spec_id,
                 content=f"Item {i}",
                 order_index=i
             )
-            db_session.add(item)
-        db_session.commit()
+            for i in range(DATABASE_CONSTANTS['MAX_ITEMS_PER_SPECIFICATION'])
+        ])
+        db_session.flush()
 
         # Try to add one more
         item = Item(
@@ -349,28 +299,8 @@ class TestItemModel:
             db_session.commit()
         db_session.rollback()
 
-    def test_item_order_validation(self, db_session):
-        """Test item order index validation."""
-        user = User(
-            google_id="123456789012345678901",
-            email="test@example.com"
-        )
-        db_session.add(user)
-        project = Project(
-            title="Test Project",
-            owner_id=user.google_id
-        )
-        db_session.add(project)
-        spec = Specification(
-            project_id=project.project_id,
-            content="Test Specification"
-        )
-        db_session.add(spec)
-        db_session.commit()
-
+    @pytest.mark.parametrize("order_index", [-1, None])
+    def test_item_order_validation(self, order_index):
+        """Test item order index validation without a database session."""
         with pytest.raises(ValueError, match="Order index must be between"):
-            Item(
-                spec_id=spec.spec_id,
-                content="Test Item",
-                order_index=-1
-            )
\ No newline at end of file
+            Item(spec_id=1, content="Test Item", order_index=order_index)
\ No newline at end of file
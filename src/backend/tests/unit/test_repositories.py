@@ -13,9 +13,11 @@ Version: 1.0.0
 """
 
 import pytest
+import json
 from datetime import datetime, timezone
 from typing import Dict, Any
 from unittest.mock import Mock, patch
+import fakeredis
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from redis.exceptions import RedisError
@@ -24,7 +26,7 @@ from db.repositories.users import UserRepository
 from db.repositories.projects import ProjectRepository
 from db.repositories.specifications import SpecificationRepository
 from db.repositories.items import ItemRepository
-from utils.constants import DATABASE_CONSTANTS, ERROR_MESSAGES
+from utils.constants import CACHE_CONSTANTS, DATABASE_CONSTANTS, ERROR_MESSAGES
 
 # Test Data Constants
 TEST_GOOGLE_ID = "123456789012345678901"
@@ -32,11 +34,22 @@ TEST_EMAIL = "test@example.com"
 TEST_PROJECT_TITLE = "Test Project"
 TEST_SPEC_CONTENT = "Test Specification"
 TEST_ITEM_CONTENT = "Test Item"
-
-@pytest.fixture
-def mock_redis():
-    """Fixture providing a mocked Redis client."""
-    return Mock()
+TEST_ITEM_CONTENTS = tuple(
+    f"{TEST_ITEM_CONTENT} {i}"
+    for i in range(DATABASE_CONSTANTS['MAX_ITEMS_PER_SPECIFICATION'])
+)
+
+@pytest.fixture(scope="module")
+def fake_redis():
+    """Fixture providing an in-memory Redis server shared across the module."""
+    server = fakeredis.FakeServer()
+    return fakeredis.FakeStrictRedis(server=server)
+
+@pytest.fixture(autouse=True)
+def _flush_fake_redis(fake_redis):
+    """Fixture clearing the shared Redis server after each test so cached keys never leak."""
+    yield
+    fake_redis.flushall()
 
 @pytest.fixture
 def mock_logger():
@@ -97,9 +110,9 @@ def test_project_repository_concurrent_access(db_session, benchmark):
     assert len(projects) > 0
     assert all(p.owner_id == TEST_GOOGLE_ID for p in projects)
 
-def test_specification_repository_cache(db_session, mock_redis, mock_logger):
+def test_specification_repository_cache(db_session, fake_redis, mock_logger):
     """Test specification repository caching behavior."""
-    repo = SpecificationRepository(mock_redis, mock_logger)
+    repo = SpecificationRepository(fake_redis, mock_logger)
     
     # Setup test data
     user_repo = UserRepository()
@@ -110,29 +123,38 @@ def test_specification_repository_cache(db_session, mock_redis, mock_logger):
         TEST_GOOGLE_ID,
         {"title": TEST_PROJECT_TITLE}
     )
+    cache_key = f"{CACHE_CONSTANTS['CACHE_KEY_PREFIX']}_spec:project:{project.project_id}"
     
     # Test cache miss and population
-    mock_redis.get.return_value = None
-    specs = repo.get_by_project(project.project_id, TEST_GOOGLE_ID)
-    assert mock_redis.setex.called
+    with patch.object(fake_redis, 'setex', wraps=fake_redis.setex) as setex_spy:
+        specs = repo.get_by_project(project.project_id, TEST_GOOGLE_ID)
+    assert setex_spy.called
+    assert json.loads(fake_redis.get(cache_key)) == []
     
     # Test cache hit
-    mock_redis.get.return_value = specs
+    cached_payload = [{
+        "spec_id": 1,
+        "project_id": project.project_id,
+        "content": TEST_SPEC_CONTENT,
+        "order_index": 0,
+        "created_at": None
+    }]
+    fake_redis.set(cache_key, json.dumps(cached_payload))
     cached_specs = repo.get_by_project(project.project_id, TEST_GOOGLE_ID)
-    assert cached_specs == specs
+    assert cached_specs == cached_payload
     
     # Test cache invalidation on update
     spec = repo.create_specification(project.project_id, TEST_SPEC_CONTENT, TEST_GOOGLE_ID)
-    assert mock_redis.delete.called
+    assert not fake_redis.exists(cache_key)
 
-def test_item_repository_constraints(db_session):
+def test_item_repository_constraints(db_session, fake_redis, mock_logger):
     """Test item repository business rules and constraints."""
     repo = ItemRepository()
     
     # Setup test data
     user_repo = UserRepository()
     project_repo = ProjectRepository()
-    spec_repo = SpecificationRepository(Mock(), Mock())
+    spec_repo = SpecificationRepository(fake_redis, mock_logger)
     
     user = user_repo.create_google_user(TEST_GOOGLE_ID, TEST_EMAIL)
     project = project_repo.create_project(
@@ -146,10 +168,10 @@ def test_item_repository_constraints(db_session):
     )
     
     # Test item limit enforcement
-    for i in range(DATABASE_CONSTANTS['MAX_ITEMS_PER_SPECIFICATION']):
+    for i, content in enumerate(TEST_ITEM_CONTENTS):
         item = repo.create_item({
             'spec_id': spec.spec_id,
-            'content': f"{TEST_ITEM_CONTENT} {i}",
+            'content': content,
             'order_index': i
         })
         assert item.order_index == i
@@ -203,6 +225,7 @@ async def test_repository_error_handling(db_session):
             {"title": TEST_PROJECT_TITLE}
         )
 
+@pytest.mark.benchmark
 def test_repository_performance_benchmarks(benchmark):
     """Benchmark repository operations for performance targets."""
     def setup():
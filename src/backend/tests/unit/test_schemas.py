@@ -11,9 +11,9 @@ from datetime import datetime, timezone
 from pydantic import ValidationError
 
 from api.schemas.users import UserBase, UserCreate
-from api.schemas.projects import ProjectBase
+from api.schemas.projects import ProjectBase, ProjectCreate
 from api.schemas.specifications import SpecificationBase
-from api.schemas.items import ItemBase
+from api.schemas.items import ItemBase, ItemCreate, ItemList
 from utils.validators import (
     validate_content_length,
     validate_order_index,
@@ -35,22 +35,22 @@ class TestUserSchemas:
         assert mixed_case.email == "test.user@example.com"
 
     @pytest.mark.unit
-    def test_invalid_user_base(self):
+    @pytest.mark.parametrize("email", [
+        "",  # Empty email
+        "invalid.email",  # Missing domain
+        "user@.com",  # Invalid domain format
+        "user@domain",  # Missing TLD
+        "user@mail.local",  # Special-use TLD
+        "user@localhost",  # Special-use dotless domain
+        f"{'a' * 256}@example.com",  # Too long
+        "<script>alert(1)</script>@evil.com",  # XSS attempt
+        "user@domain.com'--",  # SQL injection attempt
+    ])
+    def test_invalid_user_base(self, email):
         """Tests invalid user base schema creation."""
-        invalid_emails = [
-            "",  # Empty email
-            "invalid.email",  # Missing domain
-            "user@.com",  # Invalid domain format
-            "user@domain",  # Missing TLD
-            f"{'a' * 256}@example.com",  # Too long
-            "<script>alert(1)</script>@evil.com",  # XSS attempt
-            "user@domain.com'--",  # SQL injection attempt
-        ]
-
-        for email in invalid_emails:
-            with pytest.raises(ValidationError) as exc_info:
-                UserBase(email=email)
-            assert "email" in str(exc_info.value)
+        with pytest.raises(ValidationError) as exc_info:
+            UserBase(email=email)
+        assert "email" in str(exc_info.value)
 
     @pytest.mark.unit
     def test_valid_user_create(self):
@@ -101,20 +101,18 @@ class TestProjectSchemas:
         assert whitespace_project.title == "Padded Title"
 
     @pytest.mark.unit
-    def test_invalid_project_base(self):
+    @pytest.mark.parametrize("title", [
+        "",  # Empty title
+        "  ",  # Only whitespace
+        "<script>alert(1)</script>",  # XSS attempt
+        "Title'; DROP TABLE projects;--",  # SQL injection attempt
+        "a" * 256,  # Exceeds max length
+    ])
+    def test_invalid_project_base(self, title):
         """Tests invalid project base schema creation."""
-        invalid_titles = [
-            "",  # Empty title
-            "  ",  # Only whitespace
-            "<script>alert(1)</script>",  # XSS attempt
-            "Title'; DROP TABLE projects;--",  # SQL injection attempt
-            "a" * 256,  # Exceeds max length
-        ]
-
-        for title in invalid_titles:
-            with pytest.raises(ValidationError) as exc_info:
-                ProjectBase(title=title)
-            assert "title" in str(exc_info.value)
+        with pytest.raises(ValidationError) as exc_info:
+            ProjectBase(title=title)
+        assert "title" in str(exc_info.value)
 
 class TestSpecificationSchemas:
     """Test suite for specification-related Pydantic schemas."""
@@ -138,20 +136,18 @@ class TestSpecificationSchemas:
         assert max_order.order_index == 999999
 
     @pytest.mark.unit
-    def test_invalid_specification_content(self):
+    @pytest.mark.parametrize("content", [
+        "",  # Empty content
+        "a" * 1001,  # Exceeds max length
+        "<script>alert(1)</script>",  # XSS attempt
+        "Content'; DROP TABLE specs;--",  # SQL injection attempt
+        "Content with invalid < > characters",  # Invalid characters
+    ])
+    def test_invalid_specification_content(self, content):
         """Tests invalid specification content."""
-        invalid_contents = [
-            "",  # Empty content
-            "a" * 1001,  # Exceeds max length
-            "<script>alert(1)</script>",  # XSS attempt
-            "Content'; DROP TABLE specs;--",  # SQL injection attempt
-            "Content with invalid < > characters",  # Invalid characters
-        ]
-
-        for content in invalid_contents:
-            with pytest.raises(ValidationError) as exc_info:
-                SpecificationBase(content=content, order_index=0)
-            assert "content" in str(exc_info.value)
+        with pytest.raises(ValidationError) as exc_info:
+            SpecificationBase(content=content, order_index=0)
+        assert "content" in str(exc_info.value)
 
     @pytest.mark.unit
     def test_invalid_specification_order(self):
@@ -192,38 +188,103 @@ class TestItemSchemas:
         assert special_content.content == "Content with allowed chars: .,!?-"
 
     @pytest.mark.unit
-    def test_invalid_item_content(self):
+    @pytest.mark.parametrize("content", [
+        "",  # Empty content
+        "a" * 1001,  # Exceeds max length
+        "<div>HTML content</div>",  # HTML attempt
+        "Content'; SELECT * FROM items;--",  # SQL injection attempt
+        "Content with & symbol",  # Invalid character
+    ])
+    def test_invalid_item_content(self, content):
         """Tests invalid item content."""
-        invalid_contents = [
-            "",  # Empty content
-            "a" * 1001,  # Exceeds max length
-            "<div>HTML content</div>",  # HTML attempt
-            "Content'; SELECT * FROM items;--",  # SQL injection attempt
-            "Content with & symbol",  # Invalid character
-        ]
-
-        for content in invalid_contents:
-            with pytest.raises(ValidationError) as exc_info:
-                ItemBase(content=content, order_index=0)
-            assert "content" in str(exc_info.value)
+        with pytest.raises(ValidationError) as exc_info:
+            ItemBase(content=content, order_index=0)
+        assert "content" in str(exc_info.value)
 
     @pytest.mark.unit
     def test_items_count_validation(self):
         """Tests maximum items per specification validation."""
-        # Test maximum items limit
-        items = []
-        for i in range(MAX_ITEMS_PER_SPECIFICATION):
-            item = ItemBase(
-                content=f"Item {i}",
-                order_index=i
-            )
-            items.append(item)
+        payload = [
+            {"content": f"Item {i}", "order_index": i}
+            for i in range(MAX_ITEMS_PER_SPECIFICATION + 1)
+        ]
+
+        # Test maximum items limit, validated as one batch
+        items = ItemList.parse_obj(payload[:MAX_ITEMS_PER_SPECIFICATION]).__root__
         assert len(items) == MAX_ITEMS_PER_SPECIFICATION
+        assert all(isinstance(item, ItemBase) for item in items)
 
         # Test exceeding limit
         with pytest.raises(ValidationError) as exc_info:
-            ItemBase(
-                content=f"Item {MAX_ITEMS_PER_SPECIFICATION + 1}",
-                order_index=MAX_ITEMS_PER_SPECIFICATION
-            )
-        assert "maximum number of items" in str(exc_info.value).lower()
\ No newline at end of file
+            ItemList.parse_obj(payload)
+        assert "maximum number of items" in str(exc_info.value).lower()
+
+class TestCompiledSchemaParsing:
+    """Test suite verifying the compiled fast path matches full pydantic parsing."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("model, data", [
+        (ProjectCreate, {"title": "Test Project"}),
+        (ProjectCreate, {"title": "  Padded Title  "}),  # Stripped whitespace
+        (ProjectCreate, {"title": 12345}),  # Integer coerced to string
+        (ProjectCreate, {"title": "Test Project", "owner_id": 1}),  # Extra field
+        (ItemCreate, {"content": "Item content", "order_index": 0, "spec_id": 1}),
+        (ItemCreate, {"content": "Item content", "order_index": "5", "spec_id": 1}),  # Numeric string
+        (ItemCreate, {"content": "Item content", "order_index": 0, "spec_id": "1"}),  # Numeric string
+        (ItemCreate, {"content": "Item content", "order_index": 0, "spec_id": 1, "id": 7}),  # Extra field
+    ])
+    def test_fast_parse_accepts_like_parse_obj(self, model, data):
+        """Tests that fast_parse accepts the same bodies as parse_obj with identical values."""
+        expected = model.parse_obj(data)
+        parsed = model.fast_parse(data)
+
+        assert parsed.dict() == expected.dict()
+        assert [type(value) for value in parsed.dict().values()] == \
+            [type(value) for value in expected.dict().values()]
+        assert parsed.__fields_set__ == expected.__fields_set__
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("model, data", [
+        (ProjectCreate, {"title": "<script>"}),  # Invalid character
+        (ProjectCreate, {"title": "Tom & Jerry"}),  # Invalid character
+        (ProjectCreate, {"title": "Title; DROP TABLE projects"}),  # Invalid character
+        (ProjectCreate, {"title": ""}),  # Empty title
+        (ProjectCreate, {}),  # Missing field
+        (ProjectCreate, {"owner_id": 1}),  # Only extra fields
+        (ItemCreate, {"content": "Content with & symbol", "order_index": 0, "spec_id": 1}),
+        (ItemCreate, {"content": "Item content", "order_index": 1.0, "spec_id": 1}),  # Float
+        (ItemCreate, {"content": "Item content", "order_index": 1.5, "spec_id": 1}),  # Float
+        (ItemCreate, {"content": "Item content", "order_index": True, "spec_id": 1}),  # Bool
+        (ItemCreate, {"content": "Item content", "order_index": "first", "spec_id": 1}),  # String
+        (ItemCreate, {"content": "Item content", "order_index": 0, "spec_id": 0}),  # Out of range
+        (ItemCreate, {"content": "Item content", "order_index": 0, "spec_id": "one"}),  # String
+        (ItemCreate, {"content": "Item content", "order_index": 0}),  # Missing field
+    ])
+    def test_fast_parse_rejects_like_parse_obj(self, model, data):
+        """Tests that fast_parse rejects the same bodies as parse_obj with identical errors."""
+        with pytest.raises(ValidationError) as expected:
+            model.parse_obj(data)
+        with pytest.raises(ValidationError) as parsed:
+            model.fast_parse(data)
+
+        assert parsed.value.errors() == expected.value.errors()
+
+    @pytest.mark.unit
+    def test_fast_parse_json_valid_body(self):
+        """Tests that a valid raw JSON body parses like parse_raw."""
+        raw = b'{"content": "Item content", "order_index": 0, "spec_id": 1}'
+        assert ItemCreate.fast_parse_json(raw).dict() == ItemCreate.parse_raw(raw).dict()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("raw", [
+        b'{"title": ',  # Malformed JSON
+        b'',  # Empty body
+        b'[]',  # Array body
+        b'[["title", "Test Project"]]',  # Key/value pairs parse_obj would coerce
+        b'"Test Project"',  # String body
+        b'null',  # Null body
+    ])
+    def test_fast_parse_json_invalid_body(self, raw):
+        """Tests that malformed and non-object JSON bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            ProjectCreate.fast_parse_json(raw)
@@ -9,7 +9,11 @@ import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone
 from typing import Dict, Any
+from sqlalchemy.orm import Session
 
+from api.auth.google import GoogleAuthClient
+from db.repositories.projects import ProjectRepository
+from db.repositories.users import UserRepository
 from services.auth import AuthenticationService
 from services.projects import ProjectService
 from services.specifications import SpecificationService
@@ -32,14 +36,16 @@ class TestAuthenticationService:
     """Test suite for authentication service covering Google OAuth flow and session management."""
 
     @pytest.fixture
-    def auth_service(self):
+    def auth_service(self, mock_factory):
         """Fixture providing configured authentication service with mocked dependencies."""
         service = AuthenticationService()
-        service._google_client = MagicMock()
-        service._jwt_handler = MagicMock()
-        service._user_repository = MagicMock()
+        service._google_client = mock_factory(GoogleAuthClient)
+        # Unspecced: the service calls is_blacklisted, which JWTHandler does not define
+        service._jwt_handler = mock_factory()
+        service._user_repository = mock_factory(UserRepository)
         return service
 
+    @pytest.mark.auth
     async def test_authenticate_google_user_success(self, auth_service):
         """Test successful Google OAuth authentication flow with token generation."""
         # Setup mock responses
@@ -93,15 +99,25 @@ class TestAuthenticationService:
         auth_service._jwt_handler.validate_token.assert_called_once()
         auth_service._user_repository.get_by_google_id.assert_called_once_with(MOCK_GOOGLE_ID)
 
+@pytest.mark.unit
+def test_authentication_services_do_not_share_session(mock_factory):
+    """Test that each authentication service gets its own repository session."""
+    with patch('db.repositories.base.SessionLocal', side_effect=lambda: mock_factory(Session)), \
+            patch('services.auth.Counter'), patch('services.auth.Histogram'):
+        first = AuthenticationService()
+        second = AuthenticationService()
+
+    assert first._user_repository is not second._user_repository
+    assert first._user_repository._db is not second._user_repository._db
+
 @pytest.mark.asyncio
 class TestProjectService:
     """Test suite for project service covering CRUD operations and caching."""
 
     @pytest.fixture
-    def project_service(self):
+    def project_service(self, mock_factory):
         """Fixture providing configured project service with mocked dependencies."""
-        repository = MagicMock()
-        return ProjectService(repository)
+        return ProjectService(mock_factory(ProjectRepository))
 
     async def test_get_user_projects_success(self, project_service):
         """Test successful project listing with cache integration."""
@@ -2,26 +2,32 @@
 WSGI entry point file that creates and exposes the Flask application instance for production deployment.
 Implements robust error handling, environment validation, and monitoring support.
 
+Performance targets assume a PGO + LTO CPython build (--enable-optimizations --with-lto),
+as provided by the official python base images used in the Dockerfile.
+
 Version: 1.0.0
 """
 
 import os
 import logging
 import sys
-from typing import Optional
+from typing import Any, Dict, FrozenSet, Optional
+
+from flask import Flask
 
-from src.main import create_app
+from src.main import create_app as build_app
 
 # Configure logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO,
-    stream=sys.stdout
-)
 logger = logging.getLogger('wsgi')
 
+# Set once init_logging has attached the root handler
+_CONFIGURED = False
+
 # Valid deployment environments
-VALID_ENVIRONMENTS = ['production', 'staging', 'development']
+VALID_ENVIRONMENTS: FrozenSet[str] = frozenset(('production', 'staging', 'development'))
+
+# Applications already created, keyed by validated environment
+_APPLICATIONS: Dict[str, Flask] = {}
 
 def validate_environment(env: Optional[str]) -> str:
     """
@@ -44,11 +50,16 @@ def validate_environment(env: Optional[str]) -> str:
         return 'production'
     return env
 
-def init_logging() -> None:
+def init_logging() -> Dict[str, Any]:
     """
     Initializes logging configuration for the WSGI application.
     Configures log levels, handlers and formats based on environment.
+
+    Returns:
+        Dict[str, Any]: Logging settings for the startup record
     """
+    global _CONFIGURED
+
     # Get environment-specific log level
     env = os.getenv('FLASK_ENV', 'production')
     log_level = logging.DEBUG if env == 'development' else logging.INFO
@@ -57,8 +68,8 @@ def init_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Add handler if none exists
-    if not root_logger.handlers:
+    # Add handler only once, even if logging is initialized again
+    if not _CONFIGURED:
         handler = logging.StreamHandler(sys.stdout)
         handler.setFormatter(
             logging.Formatter(
@@ -66,39 +77,84 @@ def init_logging() -> None:
             )
         )
         root_logger.addHandler(handler)
+        _CONFIGURED = True
     
-    logger.info(
-        "Logging initialized",
-        extra={
-            'environment': env,
-            'log_level': logging.getLevelName(log_level)
-        }
-    )
+    return {
+        'environment': env,
+        'log_level': logging.getLevelName(log_level)
+    }
 
-# Initialize logging
-init_logging()
+def configure_and_create(env: Optional[str] = None) -> Flask:
+    """
+    Initializes logging and returns the Flask application for an environment.
+    Nothing is configured at import; Gunicorn loads this as the
+    ``wsgi:configure_and_create()`` factory, so with --preload it runs in the
+    master before workers fork.
 
-try:
-    # Validate environment and create Flask app
-    env = validate_environment(os.getenv('FLASK_ENV', 'production'))
-    app = create_app(env)
-    
+    Args:
+        env: Requested environment name, defaults to FLASK_ENV; validated after
+            logging is configured
+
+    Returns:
+        Flask: Configured application instance, shared per validated environment
+
+    Raises:
+        Exception: If application initialization fails
+    """
+    logging_settings = init_logging()
+    app_env = validate_environment(env if env is not None else os.getenv('FLASK_ENV', 'production'))
+
+    # Every spelling of the same environment resolves to a single instance
+    flask_app = _APPLICATIONS.get(app_env)
+    if flask_app is None:
+        flask_app = _APPLICATIONS[app_env] = _create_application(app_env, logging_settings)
+    return flask_app
+
+def _create_application(app_env: str, logging_settings: Dict[str, Any]) -> Flask:
+    """
+    Creates the Flask application and emits the startup record.
+
+    Args:
+        app_env: Validated environment name
+        logging_settings: Settings returned by init_logging
+
+    Returns:
+        Flask: Configured application instance
+
+    Raises:
+        Exception: If application initialization fails
+    """
+    try:
+        flask_app = build_app(app_env)
+    except Exception as e:
+        logger.critical(
+            "Failed to initialize WSGI application",
+            extra={'error': str(e)},
+            exc_info=True
+        )
+        raise
+
+    # Emit a single structured startup record
     logger.info(
-        "WSGI application initialized successfully",
+        "WSGI startup",
         extra={
-            'environment': env,
-            'debug': app.debug,
-            'testing': app.testing
+            'startup': {
+                'logging_init': logging_settings,
+                'app_init': {
+                    'environment': app_env,
+                    'debug': flask_app.debug,
+                    'testing': flask_app.testing
+                }
+            }
         }
     )
+    return flask_app
 
-except Exception as e:
-    logger.critical(
-        "Failed to initialize WSGI application",
-        extra={'error': str(e)},
-        exc_info=True
-    )
-    raise
+def create_app() -> Flask:
+    """
+    Application factory discovered by the ``flask`` CLI (``FLASK_APP=wsgi``).
 
-# Export WSGI application
-application = app.wsgi_app
\ No newline at end of file
+    Returns:
+        Flask: Configured application instance for FLASK_ENV
+    """
+    return configure_and_create()